@@ -3,4 +3,5 @@
 from extend_inplace.main import (  # noqa
     Extend,
     ExistingAttributeError,
+    extend_classes,
 )
@@ -1,11 +1,16 @@
-import inspect
-from typing import (
-    Callable,
-    Optional,
-    Iterable,
-    Any,
-    cast
-)
+from __future__ import annotations
+import weakref
+from collections.abc import Iterable
+from types import FunctionType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import (
+        Callable,
+        Optional,
+        Any,
+        Mapping,
+    )
 
 """
 KEY TERMS (in context of this module)
@@ -22,7 +27,20 @@ push:
 
 """
 
-_history = set()
+# Attribute names pushed by the user, per target class (keyed by ``id()``)
+_history: dict[int, set[str]] = {}
+
+# Attributes of a push group's class namespace that are never pushed.
+# ``__firstlineno__`` and ``__static_attributes__`` are set by Python 3.13+
+_EXCLUDE_ATTRS = frozenset((
+    "__weakref__",
+    "__dict__",
+    "__module__",
+    "__doc__",
+    "__qualname__",
+    "__firstlineno__",
+    "__static_attributes__",
+))
 
 
 class ExistingAttributeError(Exception):
@@ -83,7 +101,7 @@ class _ExtendMeta(type):
         Triggers extension and returns None when first element in `bases` is
         a child of an instance of `_ExtendMeta`. Otherwise acts normal.
         """
-        if len(bases) > 0:
+        if bases:
             if not isinstance(bases[0], _ExtendMeta):
                 raise ValueError("First parent argument must be an instance of '_ExtendMeta'")
             if to is None:
@@ -92,13 +110,14 @@ class _ExtendMeta(type):
                 else:
                     raise ValueError("missing param, 'to'")
 
-            if not isinstance(to, Iterable):
+            # Anything else is flattened and validated by ``_push_cls_attrs``
+            if isinstance(to, type):
                 to = (to,)
 
             _push_cls_attrs(cls_dict=cls_dict, to=to, **kwargs)  # type: ignore
 
-            if keep is False:
-                return cast(_ExtendMeta, None)
+            if not keep:
+                return None  # type: ignore[return-value]
 
         return super().__new__(cls, cls_name, bases, cls_dict)
 
@@ -178,6 +197,8 @@ class Extend(metaclass=_ExtendMeta):
 
     """
 
+    __slots__ = ()
+
     def __new__(  # type: ignore
         cls,
         *args: type | Iterable[type],
@@ -192,105 +213,164 @@ class Extend(metaclass=_ExtendMeta):
         if len(args) == 0:
             raise ValueError("Must pass target class(es) as arguments")
 
+        if len(args) == 1 and isinstance(args[0], type):
+            targets: tuple[type, ...] = args  # type: ignore
+        else:
+            targets = _fmt_validate_target_args(args)
+
         def inner(e: Callable[[Any], Any]):
-            if inspect.isclass(e):
+            if isinstance(e, type):
                 _push_cls_attrs(
-                    cls_dict=dict(e.__dict__),
-                    to=args,
+                    cls_dict=e.__dict__,
+                    to=targets,
                     overwrite=overwrite,
                     as_property=as_property
                 )
 
-            elif inspect.isfunction(e) or isinstance(e, (property, classmethod, staticmethod)):
+            elif isinstance(e, (FunctionType, property, classmethod, staticmethod)):
                 if isinstance(e, property):
-                    attr_name = getattr(e.fget, '__name__')
+                    attr_name = e.fget.__name__
                 else:
-                    attr_name = getattr(e, '__name__')
-
-                for target in _fmt_validate_target_args(args):
-                    _push_attr(
-                        target_cls=target,
-                        attr_name=attr_name,
-                        attr_obj=e,
-                        overwrite=overwrite,
-                        as_property=as_property,
-                    )
+                    attr_name = e.__name__
+
+                _push_attrs(
+                    attrs={attr_name: _as_property(attr_name, e) if as_property else e},
+                    targets=targets,
+                    overwrite=overwrite,
+                )
             else:
                 raise ValueError("Don't know how to handle this")  # Should come up missing in cov
 
-            if keep is True:
+            if keep:
                 return e
 
         return inner
 
 
+def extend_classes(
+    to: type | Iterable[type],
+    attrs: Mapping[str, Any],
+    *,
+    overwrite: bool = False,
+    as_property: bool = False,
+) -> None:
+    """
+    Push every attribute in ``attrs`` to each target in ``to``, without defining
+    a placeholder class. Takes the same options as ``Extend``, except ``keep``.
+
+    Unlike a push group, ``attrs`` is pushed as-is: no dunder names are
+    filtered out, so pass exactly the attributes you want.
+
+    Examples
+    --------
+
+    >>> import pandas as pd
+    >>> def nrows(self):
+    ...     return self.shape[0]
+    ...
+    >>> extend_classes([pd.DataFrame, pd.Series], {'nrows': nrows}, as_property=True)
+    >>> pd.DataFrame().nrows
+    0
+    """
+
+    # Convert once; the same property is shared by all targets
+    if as_property:
+        attrs = {
+            attr_name: _as_property(attr_name, attr_obj)
+            for attr_name, attr_obj in attrs.items()
+        }
+
+    _push_attrs(attrs=attrs, targets=_fmt_validate_target_args(to), overwrite=overwrite)
+
+
 def _push_cls_attrs(
-    cls_dict: dict[str, Any],
-    to: tuple[type | Iterable[type], ...],
+    cls_dict: Mapping[str, Any],
+    to: type | Iterable[type],
     overwrite: bool = False,
     as_property: bool = False,
 ) -> None:
     """
-    Sets user-defined attributes in ``cls_dict`` as attributes of each target in ``to``
+    Sets user-defined attributes in ``cls_dict`` as attributes of each target in ``to``.
+    ``to`` may be nested; it's flattened and validated into a ``tuple`` of types.
     """
 
-    exclude_attrs = [
-        "__weakref__",
-        "__dict__",
-        "__module__",
-        "__doc__",
-        "__qualname__"
-     ]
-
-    for attr_name, attr_obj in cls_dict.items():
-        if attr_name in exclude_attrs:
-            continue
-        for target_cls in _fmt_validate_target_args(to):
-            _push_attr(
-                target_cls=target_cls,
-                attr_name=attr_name,
-                attr_obj=attr_obj,
-                overwrite=overwrite,
-                as_property=as_property,
-            )
-
-
-def _push_attr(
-    target_cls: type,
-    attr_name: str,
-    attr_obj: Callable[[Any], Any] | property,
+    # Copy, since ``cls_dict`` may still be used to create the class (``keep=True``)
+    attrs = dict(cls_dict)
+    for attr_name in _EXCLUDE_ATTRS:
+        attrs.pop(attr_name, None)
+
+    extend_classes(to, attrs, overwrite=overwrite, as_property=as_property)
+
+
+def _push_attrs(
+    attrs: Mapping[str, Any],
+    targets: tuple[type, ...],
     overwrite: bool,
-    as_property: bool,
 ) -> None:
     """
-    Validate and push attribute, and record history.
+    Validate and push attributes to each target, and record history. Property
+    conversion (``as_property=True``) must be done by the caller, with ``_as_property()``.
+
+    All attributes are validated against every target before any of them are
+    pushed, so each target's attributes are set in one batch. ``overwrite``
+    is only tested once per call, not per attribute.
 
     Raise
     -----
-    TypeError:
-        When ``as_property=True`` but ``attr`` is not a valid function
-    ValueError:
-        When ``as_property=True`` and ``attr`` takes invalid number of params (!= 1)
     ExistingAttributeError:
         When an attribute that isn't in ``_history`` is already exists on target, and ``overwrite=False``
     """
-    if as_property is True and not isinstance(attr_obj, property):
-        if not inspect.isfunction(attr_obj):
-            raise TypeError(
-                f"Can't convert '{attr_name}' from type '{type(attr_obj)}', to property"
-            )
-        if 1 != (num_params := len(inspect.getfullargspec(attr_obj).args)):
-            raise ValueError(
-                f"Function '{attr_name}' must require exactly 1 positional argument for it to "
-                f"be converted to a property. It's defined to take {num_params}."
-            )
-        attr_obj = property(attr_obj)
+    if not overwrite:
+        for target_cls in targets:
+            for attr_name in attrs:
+                _validate_non_existing_attribute(target_cls=target_cls, attr_name=attr_name)
+
+    for target_cls in targets:
+        _push_many(target_cls, attrs)
+
+
+def _push_many(target_cls: type, attrs: Mapping[str, Any]) -> None:
+    """
+    Push every attribute in ``attrs`` to ``target_cls`` back to back, and record
+    history. Attributes must already be converted and validated. Attributes
+    the target already holds (identical objects) are not set again.
+    """
+    target_dict = target_cls.__dict__
+    for attr_name, attr_obj in attrs.items():
+        if target_dict.get(attr_name) is not attr_obj:
+            setattr(target_cls, attr_name, attr_obj)
+
+    if (history := _history.get(cls_id := id(target_cls))) is None:
+        history = _history[cls_id] = set()
+        # ids can be reused once a class is collected, so forget it with its class
+        weakref.finalize(target_cls, _history.pop, cls_id, None)
 
-    if overwrite is False:
-        _validate_non_existing_attribute(target_cls=target_cls, attr_name=attr_name)
+    history.update(attrs)
 
-    _history.add(_make_history_key(target_cls, attr_name))
-    setattr(target_cls, attr_name, attr_obj)
+
+def _as_property(attr_name: str, attr_obj: Any) -> Any:
+    """
+    Convert ``attr_obj`` to a ``property``, unless it already is one.
+
+    Raise
+    -----
+    TypeError:
+        When ``attr_obj`` is not a function
+    ValueError:
+        When ``attr_obj`` takes invalid number of params (!= 1)
+    """
+    if isinstance(attr_obj, property):
+        return attr_obj
+    if not isinstance(attr_obj, FunctionType):
+        raise TypeError(
+            f"Can't convert '{attr_name}' from type '{type(attr_obj)}', to property"
+        )
+    if (num_params := attr_obj.__code__.co_argcount) != 1:
+        raise ValueError(
+            f"Function '{attr_name}' must require exactly 1 positional argument for it to "
+            f"be converted to a property. It's defined to take {num_params}."
+        )
+    return property(attr_obj)
 
 
 def _validate_non_existing_attribute(
@@ -306,83 +386,99 @@ def _validate_non_existing_attribute(
         When an uncached attribute already exists on target, and ``overwrite = False``
     """
     if (
-        hasattr(target_cls, attr_name) and
-        (history_key := _make_history_key(target_cls, attr_name)) not in _history
+        attr_name not in _history.get(id(target_cls), ()) and
+        _mro_has(target_cls, attr_name)
     ):
+        history_key = _make_history_key(target_cls, attr_name)
         raise ExistingAttributeError(
             f"{'.'.join([k if k is not None else '<Unknown>' for k in history_key])} "
             "already exists. Pass `overwrite = True` to avoid this error."
         )
 
 
+def _mro_has(target_cls: type, attr_name: str) -> bool:
+    """
+    Check whether ``attr_name`` is defined anywhere in the MRO of ``target_cls``,
+    or of its metaclass (like ``hasattr()`` would find). Unlike ``hasattr()``,
+    this never triggers descriptor ``__get__`` calls.
+
+    >>> _mro_has(dict, 'keys')
+    True
+    >>> _mro_has(dict, 'mro')
+    True
+    >>> _mro_has(dict, 'nonsense')
+    False
+    """
+    for klass in (*target_cls.__mro__, *type(target_cls).__mro__):  # type: ignore[misc]
+        if attr_name in klass.__dict__:
+            return True
+    return False
+
+
 def _make_history_key(
     target_cls: type, attr_name: str
 ) -> tuple[str | None, str | None, str]:
     """
-    Since ``_history`` persists globally, a robust unique identifier
-    for each history record is needed: (module name, class name, attr name)
+    Fully qualified identifier for an attribute on a target class:
+    (module name, class name, attr name). Only used to format error messages.
+    The module name is read from ``__module__``, which is what ``inspect.getmodule``
+    resolves for classes, without its ``sys.modules`` lookup.
 
     Examples
     --------
-    >>> import pandas as pd
-    >>> _make_history_key(pd.DataFrame, "bar")
-    ('pandas.core.frame', 'DataFrame', 'bar')
+    >>> from collections import OrderedDict
+    >>> _make_history_key(OrderedDict, "bar")
+    ('collections', 'OrderedDict', 'bar')
 
     """
 
     return (
-        module.__name__ if (module := inspect.getmodule(target_cls)) is not None else None,
-        target_cls.__name__ if hasattr(target_cls, '__name__') else None,
+        getattr(target_cls, '__module__', None),
+        getattr(target_cls, '__name__', None),
         attr_name
     )
 
 
 def _fmt_validate_target_args(
-    args: tuple[type | Iterable[type], ...],
+    args: type | Iterable[Any],
 ) -> tuple[type, ...]:
     """
     Flatten and validate args of unknown format into a tuple of types
-    """
-
-    args = _flatten_iterable(args)
-
-    if not all(isinstance(x, type) for x in args):
-        raise TypeError("Targets must be of type, 'type'")
-    else:
-        return args  # type: ignore
-
 
-def _flatten_iterable(
-    args: Any
-) -> tuple[Any, ...]:
-    """
-    Turns anything into a flattened tuple of non-iterable (str, bytes excluded) values
-
-    >>> _flatten_iterable(int)
+    >>> _fmt_validate_target_args(int)
     (<class 'int'>,)
 
-    >>> _flatten_iterable(['hi'])
-    ('hi',)
+    >>> _fmt_validate_target_args([int, (str, [float]), [((bool,))]])
+    (<class 'int'>, <class 'str'>, <class 'float'>, <class 'bool'>)
 
-    >>> _flatten_iterable(['hi', (1,3, [8]), [((3,3,3))]])
-    ('hi', 1, 3, 8, 3, 3, 3)
+    >>> _fmt_validate_target_args([int, ['hi']])
+    Traceback (most recent call last):
+        ...
+    TypeError: Targets must be of type, 'type'. Got 'hi'
     """
 
-    def valid_iterable(e: Any) -> bool:
-        if isinstance(e, Iterable) and not isinstance(e, (str, bytes)):
-            return True
-        return False
-
-    def flatten(elems: Iterable[Any]):
-        for e in elems:
-            if valid_iterable(e):
-                yield from flatten(e)
-            else:
-                yield e
-
-    args = args if valid_iterable(args) else (args,)
-
-    return tuple(flatten(args))
+    # Fast path: decorator usage almost always passes a flat tuple of types
+    if type(args) is tuple:
+        for x in args:
+            if not isinstance(x, type):
+                break
+        else:
+            return args  # type: ignore
+
+    targets: list[type] = []
+    stack: list[Any] = [args]
+    while stack:
+        e = stack.pop()
+        if isinstance(e, type):
+            targets.append(e)
+        elif isinstance(e, (list, tuple)):
+            stack.extend(reversed(e))
+        elif isinstance(e, (str, bytes)) or not isinstance(e, Iterable):
+            raise TypeError(f"Targets must be of type, 'type'. Got {e!r}")
+        else:
+            stack.extend(reversed(tuple(e)))
+
+    return tuple(targets)
 
 
 if __name__ == '__main__':
@@ -7,6 +7,7 @@ from pandas import DataFrame, Series
 from extend_inplace import (
     Extend,
     ExistingAttributeError,
+    extend_classes,
 )
 
 
@@ -157,6 +158,22 @@ def test_other_types():
     assert DataFrame.static('hi') == 'hi'
 
 
+def test_extend_classes():
+    def ten(self):
+        return 10
+
+    extend_classes([DataFrame, Series], {'ten': ten}, as_property=True)
+
+    assert DataFrame().ten == 10
+    assert Series(dtype=int).ten == 10
+
+    with pytest.raises(ExistingAttributeError):
+        extend_classes(DataFrame, {'iloc': ten})
+
+    extend_classes(DataFrame, {'ten': ten}, overwrite=True)
+    assert DataFrame().ten() == 10
+
+
 def test_args_cls():
     class _(Extend, DataFrame):
         def a(self): ...
@@ -199,6 +216,25 @@ def test_existing_attr():
     assert df.shape() == "shape"
 
 
+def test_existing_attr_pushes_nothing():
+    with pytest.raises(ExistingAttributeError):
+        class _(Extend, DataFrame):
+            def not_pushed_before_error(self): ...
+            def iloc(self): ...
+
+    assert not hasattr(DataFrame, 'not_pushed_before_error')
+
+
+def test_existing_metaclass_attr():
+    import abc
+
+    with pytest.raises(ExistingAttributeError):
+        @Extend(abc.ABC)
+        def register(self): ...
+
+    assert abc.ABC.register.__func__ is abc.ABCMeta.register
+
+
 def test_keep():
     @Extend(DataFrame)
     def a(self):
@@ -213,6 +249,33 @@ def test_keep():
     assert not locals().get('a') is None
 
 
+def test_keep_subclass():
+    class Kept(Extend, DataFrame, keep=True):
+        def kept_subclass_attr(self):
+            return 'kept'
+
+    assert Kept is not None
+    assert Kept.__bases__ == (Extend,)
+    assert DataFrame().kept_subclass_attr() == 'kept'
+
+
+def test_metaclass_setattr_runs():
+    seen = []
+
+    class Meta(type):
+        def __setattr__(cls, name, value):
+            seen.append(name)
+            super().__setattr__(name, value)
+
+    class Target(metaclass=Meta):
+        pass
+
+    @Extend(Target)
+    def hooked(self): ...
+
+    assert seen == ['hooked']
+
+
 def test_history():
     # No error should be thrown if replacing a user-defined attribute
     @Extend(DataFrame)
@@ -226,6 +289,24 @@ def test_history():
             return
 
 
+def test_history_released_with_target():
+    import gc
+    from extend_inplace.main import _history
+
+    class Temporary:
+        pass
+
+    @Extend(Temporary)
+    def a(self): ...
+
+    cls_id = id(Temporary)
+    assert _history[cls_id] == {'a'}
+
+    del Temporary
+    gc.collect()
+    assert cls_id not in _history
+
+
 def main_():
     import pandas as pd
 